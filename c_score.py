@@ -28,7 +28,7 @@ class CriticalityScorer:
             'subscribers_count': 1.0,
             'language_count': 0.5,
         }
-        
+
     def load_project_data(self, file_path=None, sample_data=False):
         if sample_data or file_path is None:
             return self._generate_sample_data()
@@ -36,41 +36,34 @@ class CriticalityScorer:
             return pd.read_csv(file_path)
     
     def _generate_sample_data(self):
-        np.random.seed(42)
-        projects = []
-        
+        rng = np.random.default_rng(42)
+
         project_names = [
             'critical-crypto-lib', 'data-pipeline-core', 'network-security-utils',
             'database-connector', 'logging-framework', 'config-parser',
             'http-client-lib', 'authentication-service', 'cache-manager',
             'serialization-lib', 'compression-utils', 'validation-framework'
         ]
-        
-        for i, name in enumerate(project_names):
-            created_days_ago = np.random.randint(30, 2000)
-            updated_days_ago = np.random.randint(1, 365)
-            
-            project = {
-                'name': name,
-                'url': f'https://github.com/DeepFunding/{name}',
-                'created_since': created_days_ago,
-                'updated_since': updated_days_ago,
-                'contributor_count': np.random.randint(1, 100),
-                'org_count': np.random.randint(1, 20),
-                'commit_frequency': np.random.uniform(0.1, 10.0),
-                'recent_releases': np.random.randint(0, 20),
-                'closed_issues_count': np.random.randint(5, 500),
-                'updated_issues_count': np.random.randint(1, 100),
-                'new_contributors': np.random.randint(0, 30),
-                'dependents_count': np.random.randint(10, 10000),
-                'subscribers_count': np.random.randint(5, 1000),
-                'language_count': np.random.randint(1, 8),
-                'stars': np.random.randint(10, 50000),
-                'forks': np.random.randint(5, 5000)
-            }
-            projects.append(project)
-        
-        return pd.DataFrame(projects)
+        n = len(project_names)
+
+        return pd.DataFrame({
+            'name': project_names,
+            'url': [f'https://github.com/DeepFunding/{name}' for name in project_names],
+            'created_since': rng.integers(30, 2000, n),
+            'updated_since': rng.integers(1, 365, n),
+            'contributor_count': rng.integers(1, 100, n),
+            'org_count': rng.integers(1, 20, n),
+            'commit_frequency': rng.uniform(0.1, 10.0, n),
+            'recent_releases': rng.integers(0, 20, n),
+            'closed_issues_count': rng.integers(5, 500, n),
+            'updated_issues_count': rng.integers(1, 100, n),
+            'new_contributors': rng.integers(0, 30, n),
+            'dependents_count': rng.integers(10, 10000, n),
+            'subscribers_count': rng.integers(5, 1000, n),
+            'language_count': rng.integers(1, 8, n),
+            'stars': rng.integers(10, 50000, n),
+            'forks': rng.integers(5, 5000, n)
+        })
     
     def normalize_metrics(self, df):
         normalized_df = df.copy()
@@ -81,53 +74,59 @@ class CriticalityScorer:
             'dependents_count', 'subscribers_count'
         ]
         
-        for metric in log_metrics:
-            if metric in df.columns:
-                log_values = np.log10(df[metric] + 1)
-                normalized_df[metric] = (log_values - log_values.min()) / (log_values.max() - log_values.min()) * 10
-        
-        if 'created_since' in df.columns:
-            normalized_df['created_since'] = (df['created_since'] / df['created_since'].max()) * 10
-        
-        if 'updated_since' in df.columns:
-            normalized_df['updated_since'] = (1 - df['updated_since'] / df['updated_since'].max()) * 10
-        
-        simple_metrics = ['language_count']
-        for metric in simple_metrics:
-            if metric in df.columns:
-                normalized_df[metric] = (df[metric] / df[metric].max()) * 10
-        
+        log_cols = [metric for metric in log_metrics if metric in df.columns]
+        if log_cols:
+            log_values = np.log10(df[log_cols].to_numpy(dtype=np.float64) + 1)
+            mn, mx = np.nanmin(log_values, axis=0), np.nanmax(log_values, axis=0)
+            span = np.where(mx > mn, mx - mn, 1.0)
+            normalized_df[log_cols] = np.where(mx > mn, (log_values - mn) / span * 10, 0.0)
+
+        scale_metrics = ['created_since', 'updated_since', 'language_count']
+        scale_cols = [metric for metric in scale_metrics if metric in df.columns]
+        if scale_cols:
+            values = df[scale_cols].to_numpy(dtype=np.float64)
+            mx = np.nanmax(values, axis=0)
+            scaled = np.zeros_like(values)
+            np.divide(values, mx, out=scaled, where=mx != 0)
+            scaled *= 10
+            if 'updated_since' in scale_cols:
+                inverted = scaled[:, scale_cols.index('updated_since')]
+                np.subtract(10, inverted, out=inverted)
+            normalized_df[scale_cols] = scaled
+
         return normalized_df
     
     def calculate_criticality_score(self, df):
         normalized_df = self.normalize_metrics(df)
-        scores = []
-        
-        for _, row in normalized_df.iterrows():
-            score = 0
-            for metric, weight in self.weights.items():
-                if metric in row:
-                    score += weight * row[metric]
-            scores.append(max(0, score))  
-        
+
+        cols = [metric for metric in self.weights if metric in normalized_df.columns]
+        weight_vec = np.array([self.weights[c] for c in cols], dtype=np.float64)
+        metric_matrix = normalized_df[cols].to_numpy(dtype=np.float64, copy=False)
+        scores = np.maximum(metric_matrix @ weight_vec, 0.0)
+
         df_with_scores = df.copy()
         df_with_scores['criticality_score'] = scores
-        df_with_scores['criticality_rank'] = df_with_scores['criticality_score'].rank(ascending=False, method='dense')
+        _, inverse = np.unique(-scores, return_inverse=True)
+        df_with_scores['criticality_rank'] = (inverse + 1).astype(np.float64)
         
-        return df_with_scores.sort_values('criticality_score', ascending=False)
-    
+        return df_with_scores
+
     def get_funding_priorities(self, df_scored, top_n=10):
-        return df_scored.head(top_n)[['name', 'criticality_score', 'criticality_rank', 
+        return df_scored.nlargest(top_n, 'criticality_score')[['name', 'criticality_score', 'criticality_rank',
                                      'dependents_count', 'contributor_count', 'updated_since']]
     
     def analyze_underfunded_critical_projects(self, df_scored, threshold_percentile=75):
         """Identify critical projects that might be underfunded (high criticality, low visibility)"""
-        high_criticality_threshold = np.percentile(df_scored['criticality_score'], threshold_percentile)
-        low_visibility_threshold = np.percentile(df_scored['stars'], 25)  
-        
+        scores = df_scored['criticality_score'].to_numpy()
+        stars = df_scored['stars'].to_numpy()
+
+        k_crit = min(int(len(scores) * threshold_percentile / 100), len(scores) - 1)
+        high_criticality_threshold = np.partition(scores, k_crit)[k_crit]
+        k_star = min(int(len(stars) * 0.25), len(stars) - 1)
+        low_visibility_threshold = np.partition(stars, k_star)[k_star]
+
         underfunded = df_scored[
-            (df_scored['criticality_score'] >= high_criticality_threshold) &
-            (df_scored['stars'] <= low_visibility_threshold)
+            (scores >= high_criticality_threshold) & (stars <= low_visibility_threshold)
         ]
         
         return underfunded[['name', 'criticality_score', 'stars', 'dependents_count', 
@@ -141,7 +140,7 @@ class CriticalityScorer:
         axes[0, 0].set_xlabel('Criticality Score')
         axes[0, 0].set_ylabel('Number of Projects')
         
-        top_10 = df_scored.head(10)
+        top_10 = df_scored.nlargest(10, 'criticality_score')
         axes[0, 1].barh(range(len(top_10)), top_10['criticality_score'])
         axes[0, 1].set_yticks(range(len(top_10)))
         axes[0, 1].set_yticklabels(top_10['name'], fontsize=8)
@@ -160,20 +159,26 @@ class CriticalityScorer:
         axes[1, 1].set_ylabel('Criticality Score')
         axes[1, 1].set_title('Potential Funding Gap Analysis')
         
-        z = np.polyfit(df_scored['stars'], df_scored['criticality_score'], 1)
-        p = np.poly1d(z)
-        axes[1, 1].plot(df_scored['stars'], p(df_scored['stars']), "r--", alpha=0.8)
+        x = df_scored['stars'].to_numpy(dtype=np.float64)
+        y = df_scored['criticality_score'].to_numpy(dtype=np.float64)
+        x_mean, y_mean = x.mean(), y.mean()
+        x_var = ((x - x_mean) ** 2).sum()
+        if x_var > 0:  # trend line is undefined for near-constant stars
+            slope = ((x - x_mean) * (y - y_mean)).sum() / x_var
+            intercept = y_mean - slope * x_mean
+            axes[1, 1].plot(x, slope * x + intercept, "r--", alpha=0.8)
         
         plt.tight_layout()
         return fig
     
     def generate_report(self, df_scored):
+        scores = df_scored['criticality_score'].to_numpy()
         report = {
             'summary': {
                 'total_projects': len(df_scored),
-                'avg_criticality_score': df_scored['criticality_score'].mean(),
-                'median_criticality_score': df_scored['criticality_score'].median(),
-                'std_criticality_score': df_scored['criticality_score'].std()
+                'avg_criticality_score': scores.mean(),
+                'median_criticality_score': np.median(scores),
+                'std_criticality_score': np.std(scores, ddof=1)
             },
             'top_critical_projects': self.get_funding_priorities(df_scored, 5).to_dict('records'),
             'underfunded_critical': self.analyze_underfunded_critical_projects(df_scored).head(5).to_dict('records'),
@@ -182,8 +187,12 @@ class CriticalityScorer:
         return report
     
     def _calculate_metric_correlations(self, df_scored):
-        numeric_cols = df_scored.select_dtypes(include=[np.number]).columns
-        correlations = df_scored[numeric_cols].corr()['criticality_score'].drop('criticality_score')
+        numeric_cols = df_scored.select_dtypes(include=[np.number]).columns.drop('criticality_score')
+        X = df_scored[numeric_cols].to_numpy(dtype=np.float64)
+        y = df_scored['criticality_score'].to_numpy(dtype=np.float64)
+        Xn = (X - X.mean(axis=0)) / X.std(axis=0)
+        yn = (y - y.mean()) / y.std()
+        correlations = pd.Series(Xn.T @ yn / len(y), index=numeric_cols)
         return correlations.sort_values(ascending=False).to_dict()
 
 # Example usage and demonstration
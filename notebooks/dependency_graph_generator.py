@@ -1,51 +1,70 @@
 import polars as pl
+import numpy as np
 from pyvis.network import Network
 from pathlib import Path
 import networkx as nx
 
 
+def pagerank_scipy(G, alpha=0.85, tol=1e-6, max_iter=100):
+    """PageRank via scipy sparse power iteration (nx.pagerank_scipy is gone in networkx 3.x)."""
+    nodes = list(G)
+    n = len(nodes)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight="weight", format="csr", dtype=np.float64)
+    out_weight = A.sum(axis=1)
+    dangling = out_weight == 0
+    A = A.multiply(np.where(dangling, 0.0, 1.0 / np.where(dangling, 1.0, out_weight))[:, None]).tocsr()
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        x_new = alpha * (A.T @ x + x[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(x_new - x).sum() < n * tol:
+            return dict(zip(nodes, x_new))
+        x = x_new
+    return dict(zip(nodes, x))
+
+
 sep_path = Path("dataset_Sep_9_2025")
 oct_path = Path("dataset_Oct_9_2025")
 
 def load_dataset(folder):
     return {
-        "train": pl.read_csv(folder / "train.csv"),
-        "raw_private": pl.read_csv(folder / "raw_private.csv", ignore_errors=True) if (folder / "raw_private.csv").exists() else None,
+        "train": pl.scan_csv(folder / "train.csv"),
+        "raw_private": pl.scan_csv(folder / "raw_private.csv", ignore_errors=True) if (folder / "raw_private.csv").exists() else None,
     }
 
 sep_data = load_dataset(sep_path)
 oct_data = load_dataset(oct_path)
 
 def combine_data(data):
-    dfs = [df for df in data.values() if df is not None]
-    return pl.concat(dfs, how="diagonal")
+    lfs = [lf for lf in data.values() if lf is not None]
+    return pl.concat(lfs, how="diagonal")
 
-merged_df: pl.DataFrame = pl.concat([combine_data(sep_data), combine_data(oct_data)], how="diagonal")
-
-print("Total rows:", merged_df.height)
+merged_lf: pl.LazyFrame = pl.concat([combine_data(sep_data), combine_data(oct_data)], how="diagonal")
 
 # --- Normalize columns ---
-merged_df = merged_df.with_columns([
-    pl.col("repo_a").str.strip_chars().str.strip_chars_end('/').str.to_lowercase().alias("repo_a"),
-    pl.col("repo_b").str.strip_chars().str.strip_chars_end('/').str.to_lowercase().alias("repo_b"),
-    pl.col("parent").str.strip_chars().str.strip_chars_end('/').str.to_lowercase().alias("parent")
-])
+merged_lf = merged_lf.with_columns(
+    pl.col(["repo_a", "repo_b", "parent"]).str.strip_chars().str.strip_chars_end('/').str.to_lowercase()
+)
 
-merged_df = merged_df.filter(pl.col("repo_a") != pl.col("repo_b"))
-merged_df = merged_df.drop_nulls(["repo_a", "repo_b", "parent"])
+merged_lf = merged_lf.filter(
+    (pl.col("repo_a") != pl.col("repo_b"))
+    & pl.col("repo_a").is_not_null()
+    & pl.col("repo_b").is_not_null()
+    & pl.col("parent").is_not_null()
+)
 
 # --- Create edges with weights ---
-edges_df = merged_df.select([
+edges_lf = merged_lf.select([
     pl.col("repo_a").alias("source"),
     pl.col("repo_b").alias("target"),
     pl.col("multiplier")
 ])
 
-# Aggregate duplicates
-edges_df = edges_df.group_by(["source", "target"]).agg(
-    pl.col("multiplier").mean().alias("multiplier"),
+# Aggregate duplicates; one streaming pass runs scan -> normalize -> filter -> group_by
+edges_df = edges_lf.group_by(["source", "target"]).agg(
+    pl.col("multiplier").mean().alias("weight"),
     pl.col("multiplier").count().alias("count")
-)
+).collect(engine="streaming")
 
 print(f"Total unique edges: {edges_df.height}")
 
@@ -57,18 +76,22 @@ print(f"Filtered edges (count >= {MIN_COUNT}): {edges_df.height}")
 
 # --- Build NetworkX graph for better layout preprocessing ---
 G = nx.DiGraph()
-
-for row in edges_df.iter_rows(named=True):
-    G.add_edge(row["source"], row["target"], weight=row["multiplier"], count=row["count"])
+G.add_edges_from(
+    (source, target, {"weight": weight, "count": count})
+    for source, target, weight, count in edges_df.select(["source", "target", "weight", "count"]).iter_rows()
+)
 
 # --- Filter to largest connected component (optional) ---
-if not nx.is_weakly_connected(G):
-    largest_cc = max(nx.weakly_connected_components(G), key=len)
-    G = G.subgraph(largest_cc).copy()
+components = list(nx.weakly_connected_components(G))
+if len(components) > 1:
+    G = G.subgraph(max(components, key=len)).copy()
     print(f"Using largest connected component: {len(G.nodes())} nodes, {len(G.edges())} edges")
 
 # --- Compute node importance (PageRank or degree) ---
-pagerank = nx.pagerank(G, alpha=0.85)
+pagerank = pagerank_scipy(G, alpha=0.85, tol=1e-6)
+
+# --- Precompute layout offline so the browser skips physics stabilization ---
+pos = nx.spring_layout(G, k=1 / np.sqrt(len(G)), iterations=100, seed=0)
 
 # --- Initialize PyVis with better defaults ---
 net = Network(
@@ -81,51 +104,45 @@ net = Network(
 )
 
 # --- Add nodes with size based on importance ---
-for node in G.nodes():
-    importance = pagerank.get(node, 0)
-    node_size = 10 + (importance * 500)  # Scale size by PageRank
-    
-    net.add_node(
-        node, 
-        label=node.split("/")[-1],  # Show only repo name
-        title=f"{node}\nImportance: {importance:.4f}",  # Hover info
-        size=node_size,
-        color="#4a9eff"
-    )
-
-# --- Add edges with width based on count ---
-for source, target, data in G.edges(data=True):
-    edge_width = min(data['count'] * 0.5, 5)  # Cap width at 5
-    
-    net.add_edge(
-        source, 
-        target, 
-        value=edge_width,
-        title=f"Count: {data['count']}, Multiplier: {data['weight']:.2f}"
-    )
+nodes = list(G.nodes())
+importances = np.fromiter((pagerank.get(node, 0) for node in nodes), dtype=np.float64, count=len(nodes))
+sizes = 10 + importances * 500  # Scale size by PageRank
+coords = np.array([pos[node] for node in nodes]) * 1000
+
+net.add_nodes(
+    nodes,
+    label=[node.rsplit("/", 1)[-1] for node in nodes],  # Show only repo name
+    title=[f"{node}\nImportance: {importance:.4f}"  # Hover info
+           for node, importance in zip(nodes, importances)],
+    size=sizes.tolist(),
+    color=["#4a9eff"] * len(nodes),
+    x=coords[:, 0].tolist(),
+    y=coords[:, 1].tolist()
+)
+
+# --- Add edges with width based on count (capped at 5) ---
+edge_src, edge_tgt, edge_counts, edge_weights = zip(*[
+    (source, target, data['count'], data['weight'])
+    for source, target, data in G.edges(data=True)
+])
+edge_widths = np.minimum(np.array(edge_counts) * 0.5, 5)
+
+net.edges.extend([
+    {
+        "from": source,
+        "to": target,
+        "value": width,
+        "title": f"Count: {count}, Multiplier: {weight:.2f}"
+    }
+    for source, target, count, weight, width
+    in zip(edge_src, edge_tgt, edge_counts, edge_weights, edge_widths.tolist())
+])
 
 # --- Optimized physics settings for clean layout ---
 net.set_options("""
 var options = {
   "physics": {
-    "enabled": true,
-    "stabilization": {
-      "enabled": true,
-      "iterations": 1000,
-      "fit": true
-    },
-    "barnesHut": {
-      "gravitationalConstant": -8000,
-      "centralGravity": 0.3,
-      "springLength": 250,
-      "springConstant": 0.04,
-      "damping": 0.2,
-      "avoidOverlap": 0.5
-    },
-    "maxVelocity": 50,
-    "minVelocity": 0.75,
-    "solver": "barnesHut",
-    "timestep": 0.5
+    "enabled": false
   },
   "edges": {
     "smooth": {
@@ -1,56 +1,69 @@
 import polars as pl
+import numpy as np
+import networkx as nx
 from pyvis.network import Network
 
 df = pl.read_csv("dataset_Oct_9_2025/train.csv")
 
-df = df.with_columns([
-    pl.col("repo_a").str.strip_chars().str.strip_chars_end("/").str.to_lowercase(),
-    pl.col("repo_b").str.strip_chars().str.strip_chars_end("/").str.to_lowercase(),
-    pl.col("parent").str.strip_chars().str.strip_chars_end("/").str.to_lowercase()
-])
+df = df.with_columns(
+    pl.col(["repo_a", "repo_b", "parent"]).str.strip_chars().str.strip_chars_end("/").str.to_lowercase()
+)
 
-df = df.filter((pl.col("repo_a") != pl.col("repo_b")) & (pl.col("multiplier") > 0))
-df = df.drop_nulls(["repo_a", "repo_b", "parent"])
+df = df.filter(
+    (pl.col("repo_a") != pl.col("repo_b"))
+    & (pl.col("multiplier") > 0)
+    & pl.col("repo_a").is_not_null()
+    & pl.col("repo_b").is_not_null()
+    & pl.col("parent").is_not_null()
+)
 
 df = df.with_columns([
-    pl.when(pl.col("repo_a") < pl.col("repo_b"))
-      .then(pl.col("repo_a")).otherwise(pl.col("repo_b")).alias("source"),
-    pl.when(pl.col("repo_a") < pl.col("repo_b"))
-      .then(pl.col("repo_b")).otherwise(pl.col("repo_a")).alias("target")
+    pl.min_horizontal("repo_a", "repo_b").alias("source"),
+    pl.max_horizontal("repo_a", "repo_b").alias("target")
 ])
 
-edges_df = df.select([
-    pl.col("source"),
-    pl.col("target"),
-    pl.when(pl.col("multiplier") < 0.5)
-      .then(0.5)
-      .when(pl.col("multiplier") > 10.0)
-      .then(10.0)
-      .otherwise(pl.col("multiplier"))
-      .alias("weight")
-]).group_by(["source", "target"]).agg(pl.col("weight").mean())
+edges_df = df.group_by(["source", "target"]).agg(
+    pl.col("multiplier").clip(0.5, 10.0).mean().alias("weight")
+)
 
 edges_df = edges_df.sort("weight", descending=True).head(1000)
 
 net = Network(height="800px", width="100%", directed=True, bgcolor="#111", font_color="#EEE")
 
-for row in edges_df.iter_rows(named=True):
-    net.add_node(row["source"], label=row["source"].split("/")[-1])
-    net.add_node(row["target"], label=row["target"].split("/")[-1])
-    net.add_edge(row["source"], row["target"], value=row["weight"])
+sources = edges_df["source"].to_list()
+targets = edges_df["target"].to_list()
+weights = edges_df["weight"].to_list()
+
+nodes_df = pl.concat([
+    edges_df.select(pl.col("source").alias("node")),
+    edges_df.select(pl.col("target").alias("node"))
+]).unique().with_columns(
+    pl.col("node").str.split("/").list.last().alias("label")
+)
+nodes = nodes_df["node"].to_list()
+
+# Precompute the layout offline so the browser skips physics stabilization
+G = nx.Graph()
+G.add_edges_from(zip(sources, targets))
+pos = nx.spring_layout(G, k=1 / np.sqrt(len(G)), iterations=100, seed=0)
+coords = np.array([pos[node] for node in nodes]) * 1000
+
+net.add_nodes(
+    nodes,
+    label=nodes_df["label"].to_list(),
+    x=coords[:, 0].tolist(),
+    y=coords[:, 1].tolist()
+)
+net.edges.extend([
+    {"from": source, "to": target, "value": weight}
+    for source, target, weight in zip(sources, targets, weights)
+])
 
-net.toggle_physics(True)
+net.toggle_physics(False)
 net.set_options("""
 var options = {
   "physics": {
-    "stabilization": { "enabled": true, "iterations": 1500 },
-    "barnesHut": {
-      "gravitationalConstant": -3000,
-      "centralGravity": 0.3,
-      "springLength": 180,
-      "springConstant": 0.05,
-      "damping": 0.1
-    }
+    "enabled": false
   },
   "edges": {
     "color": {"inherit": true},